@@ -1,10 +1,11 @@
 """
 VEXA Agent Package
+
+VexaAgent, create_vexa_agent and VexaTools are loaded on first access so that
+importing the package (e.g. for VexaConfig) doesn't pull in LangChain.
 """
 
-from .core import VexaAgent, create_vexa_agent
 from .config import VexaConfig
-from .tools import VexaTools
 
 __version__ = "1.0.0"
 __author__ = "VEXA Team"
@@ -15,3 +16,23 @@ __all__ = [
     "VexaConfig",
     "VexaTools"
 ]
+
+_LAZY_ATTRS = {
+    "VexaAgent": ".core",
+    "create_vexa_agent": ".core",
+    "VexaTools": ".tools",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        import importlib
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,21 @@
 """
 Configuration settings for the VEXA AI Agent
 """
+import functools
 import os
-from typing import Dict, List
+import tempfile
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+
+
+def _default_socket_path() -> str:
+    """Get a per-user socket path: $XDG_RUNTIME_DIR, else a private directory in the temp dir"""
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        user = os.getuid() if hasattr(os, "getuid") else os.getenv("USERNAME", "user")
+        runtime_dir = os.path.join(tempfile.gettempdir(), f"vexa-{user}")
+    return os.path.join(runtime_dir, "vexa.sock")
+
 
 class VexaConfig:
     """Configuration class for VEXA AI Agent"""
@@ -22,35 +35,96 @@ class VexaConfig:
     AGENT_NAME = "VEXA"
     AGENT_VERSION = "1.0.0"
     MAX_ITERATIONS = 10
+    # Number of recent tool observations fed back into the next query
+    OBSERVATION_HISTORY = 5
     VERBOSE = True
     
+    # Answer trivial queries (plain arithmetic, "what time is it", "pwd")
+    # with a direct tool call instead of the ReAct loop
+    FAST_PATH = True
+    
+    # Response cache settings (TTL in seconds, 0 disables the cache)
+    RESPONSE_CACHE_TTL = 300
+    RESPONSE_CACHE_SIZE = 256
+    
     # Search settings
     SEARCH_RESULTS_LIMIT = 5
     SEARCH_TIMEOUT = 30
+    SEARCH_BATCH_LIMIT = 5  # Max queries per web_search_batch call, all run concurrently
+    
+    # Ollama settings
+    # Unset by default so the Ollama client falls back to OLLAMA_HOST itself
+    OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL")
+    HEALTH_CHECK_TIMEOUT = 2
+    # How long Ollama keeps the model loaded after a request ("30m", "1h", -1 = forever)
+    KEEP_ALIVE = os.getenv("VEXA_KEEP_ALIVE", "30m")
+    # Seconds between keep-warm pings while the interactive CLI waits for input
+    KEEP_WARM_INTERVAL = 120
+    # Context window and generation limit; a smaller num_ctx means a smaller
+    # KV cache per slot, so Ollama can serve more requests in parallel
+    NUM_CTX = int(os.getenv("VEXA_NUM_CTX", "4096"))
+    NUM_PREDICT = int(os.getenv("VEXA_NUM_PREDICT", "2048"))
+    # Ollama server parallelism (these must be set for `ollama serve`;
+    # VEXA reads them to size its own concurrency)
+    OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+    OLLAMA_MAX_LOADED_MODELS = int(os.getenv("OLLAMA_MAX_LOADED_MODELS", "2"))
+    
+    # Server mode settings (python app/run_agent.py --serve)
+    SOCKET_PATH = os.getenv("VEXA_SOCKET") or _default_socket_path()
     
     # UI settings
     WEB_UI_PORT = 7860
     WEB_UI_SHARE = False
     
     @classmethod
-    def get_model_config(cls, model_name: str = None) -> Dict:
-        """Get model configuration"""
+    @functools.lru_cache(maxsize=16)
+    def get_model_config(cls, model_name: str = None) -> Mapping:
+        """Get model configuration (cached and read-only)"""
         model = model_name or cls.DEFAULT_MODEL
-        return {
+        return MappingProxyType({
             "model": model,
+            "base_url": cls.OLLAMA_BASE_URL,
             "temperature": 0.7,
             "top_p": 0.9,
-            "num_predict": 2048,
-        }
+            "num_ctx": cls.NUM_CTX,
+            "num_predict": cls.NUM_PREDICT,
+            "keep_alive": cls.get_keep_alive(),
+        })
     
     @classmethod
-    def get_agent_config(cls) -> Dict:
-        """Get agent configuration"""
-        return {
-            "max_iterations": cls.MAX_ITERATIONS,
-            "early_stopping_method": "generate",
-            "handle_parsing_errors": True,
-        }
+    def get_ollama_url(cls, base_url: str = None) -> str:
+        """Get the Ollama server URL (base_url, OLLAMA_BASE_URL, OLLAMA_HOST, then localhost)"""
+        url = (base_url or cls.OLLAMA_BASE_URL or os.getenv("OLLAMA_HOST") or "localhost").strip().rstrip("/")
+        if "://" in url:
+            return url
+        # OLLAMA_HOST is usually a bare host or host:port
+        host, _, port = url.partition(":")
+        return f"http://{host or 'localhost'}:{port or 11434}"
+    
+    @classmethod
+    def get_keep_alive(cls) -> Union[int, str]:
+        """Get the Ollama keep_alive value (plain numbers are sent as seconds)"""
+        value = str(cls.KEEP_ALIVE).strip()
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    
+    @classmethod
+    def get_agent_config(cls) -> Mapping:
+        """Get agent configuration (read-only)"""
+        return AGENT_CONFIG
+    
+    @classmethod
+    def get_ollama_tuning_hint(cls) -> Optional[str]:
+        """Get a throughput recommendation if Ollama parallelism isn't configured"""
+        if "OLLAMA_NUM_PARALLEL" in os.environ and "OLLAMA_MAX_LOADED_MODELS" in os.environ:
+            return None
+        return (
+            f"Set OLLAMA_NUM_PARALLEL={cls.OLLAMA_NUM_PARALLEL} and "
+            f"OLLAMA_MAX_LOADED_MODELS={cls.OLLAMA_MAX_LOADED_MODELS} "
+            "before running `ollama serve` for best throughput"
+        )
     
     @classmethod
     def validate_model(cls, model_name: str) -> bool:
@@ -58,6 +132,7 @@ class VexaConfig:
         return model_name in cls.AVAILABLE_MODELS
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_welcome_message(cls) -> str:
         """Get welcome message"""
         return f"""
@@ -70,3 +145,12 @@ class VexaConfig:
 
 Type your question or 'exit' to quit.
         """.strip()
+
+
+# Agent executor settings, built once
+AGENT_CONFIG = MappingProxyType({
+    "max_iterations": VexaConfig.MAX_ITERATIONS,
+    "early_stopping_method": "generate",
+    "handle_parsing_errors": True,
+    "return_intermediate_steps": True,
+})
@@ -1,17 +1,166 @@
 """
 Core agent logic for VEXA AI Agent using LangChain
+
+LangChain modules are imported when the agent is built, not at import time.
 """
-from langchain.agents import create_react_agent, AgentExecutor
-from langchain_ollama import OllamaLLM
-from langchain_core.prompts import PromptTemplate
-from langchain_core.tools import Tool
-from typing import List, Dict, Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Iterator, Optional, Tuple
+import functools
+from collections import deque
+import asyncio
+import hashlib
 import logging
+import queue
+import re
+import threading
+import time
 import traceback
 
-from .config import VexaConfig
+import requests
+
+from .config import VexaConfig, AGENT_CONFIG
 from .tools import VexaTools
 
+if TYPE_CHECKING:
+    from langchain_core.prompts import PromptTemplate
+    from langchain_core.tools import Tool
+
+
+# ReAct prompt shared by every agent; compiled once on first use
+REACT_TEMPLATE = """You are VEXA, a helpful and intelligent AI assistant. You have access to various tools to help answer questions and perform tasks.
+
+You have access to the following tools:
+{tools}
+
+Use the following format:
+
+Question: the input question you must answer
+Thought: you should always think about what to do
+Action: the action to take, should be one of [{tool_names}]
+Action Input: the input to the action
+Observation: the result of the action
+... (this Thought/Action/Action Input/Observation can repeat N times)
+Thought: I now know the final answer
+Final Answer: the final answer to the original input question
+
+Important guidelines:
+- Be helpful, accurate, and concise in your responses
+- Use tools when you need current information or to perform specific tasks
+- If you can answer directly without tools, feel free to do so
+- Always provide the most accurate and up-to-date information possible
+- If you're unsure about something, say so rather than guessing
+
+IMPORTANT: Check previous Observations in this scratchpad and any "Recent observations" in the question before making new tool calls.
+If the required data already appears above, cite it directly in the Final Answer
+instead of calling the tool again with the same parameters. Only call a tool if
+the data is unavailable or the parameters differ.
+
+Begin!
+
+Question: {input}
+Thought:{agent_scratchpad}"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_prompt() -> PromptTemplate:
+    """Compile the shared ReAct prompt"""
+    from langchain_core.prompts import PromptTemplate
+    return PromptTemplate.from_template(REACT_TEMPLATE)
+
+
+_FINAL_ANSWER = "Final Answer:"
+
+# Queued by the streamer when text it already emitted wasn't a final answer after all
+_RETRACT = object()
+
+
+def _make_final_answer_streamer(emit, retract=None):
+    """
+    Build a callback handler that passes the final answer's text to emit
+    
+    With retract, tokens after "Final Answer:" are emitted as they arrive, and
+    retract is called if the finished generation doesn't parse as a final
+    answer (e.g. the model went on to an Action). Without it, the answer is
+    emitted in one piece once its generation has parsed as a final answer.
+    """
+    from langchain_core.agents import AgentFinish
+    from langchain_core.callbacks import BaseCallbackHandler
+    from langchain.agents.output_parsers import ReActSingleInputOutputParser
+    
+    parser = ReActSingleInputOutputParser()
+    
+    class _FinalAnswerStreamer(BaseCallbackHandler):
+        def __init__(self) -> None:
+            self.text = ""
+            self.start = None  # Offset of the answer in text, None until "Final Answer:" appears
+            self.sent = ""  # Answer text already emitted for this generation
+        
+        def on_llm_start(self, serialized, prompts, **kwargs) -> None:
+            self.text, self.start, self.sent = "", None, ""
+        
+        def on_llm_new_token(self, token: str, **kwargs) -> None:
+            self.text += token
+            if retract is None:
+                return
+            if self.start is None:
+                before, marker, _ = self.text.partition(_FINAL_ANSWER)
+                # A step that also names an Action is a parsing error, not an answer
+                if not marker or "Action:" in before:
+                    return
+                self.start = len(before) + len(marker)
+            # Hold back a possible trailing Action until on_llm_end has parsed the step
+            answer = self.text[self.start:].split("\nAction", 1)[0].strip()
+            if len(answer) > len(self.sent):
+                emit(answer[len(self.sent):])
+                self.sent = answer
+        
+        def on_llm_end(self, response, **kwargs) -> None:
+            generations = response.generations[0] if response.generations else []
+            text = generations[0].text if generations else self.text
+            try:
+                parsed = parser.parse(text)
+            except Exception:
+                parsed = None
+            
+            if not isinstance(parsed, AgentFinish):
+                if self.sent:
+                    retract()
+                return
+            answer = parsed.return_values.get("output", "")
+            if not self.sent:
+                emit(answer)
+            elif answer.startswith(self.sent):
+                emit(answer[len(self.sent):])
+    
+    return _FinalAnswerStreamer()
+
+
+# Queries simple enough to send straight to one tool: (pattern, tool name, tool input)
+_FAST_ROUTES = (
+    (
+        re.compile(r"^[\s(\-]*\d[\d\s.()]*(?:(?:\*\*|[+\-*/])[\s(\-]*\d[\d\s.()]*)+$"),
+        "calculator",
+        lambda m: m.group(0).strip(),
+    ),
+    (
+        re.compile(r"^\s*(?:what(?:'s|\s+is)?\s+)?(?:the\s+)?(?:current\s+)?(date|time)(?:\s+is\s+it)?(?:\s+(?:now|today))?\s*\??\s*$", re.I),
+        "datetime",
+        lambda m: m.group(1).lower(),
+    ),
+    (
+        re.compile(r"^\s*(?:(pwd)|list(?:\s+files)?(?:\s+(?:in\s+)?([./]\S*))?)\s*$", re.I),
+        "file_ops",
+        lambda m: "pwd" if m.group(1) else f"list {m.group(2) or '.'}",
+    ),
+)
+
+# Questions whose answers go stale quickly are never served from the cache
+_TIME_SENSITIVE_RE = re.compile(r"\b(now|today|tonight|current|currently|latest|recent|time|date|news|weather)\b", re.I)
+
+# Tools whose observations go stale; answers built on them are never cached
+_UNCACHEABLE_TOOLS = frozenset({"web_search", "web_search_batch", "datetime", "weather", "file_ops"})
+
 
 class VexaAgent:
     """Main VEXA AI Agent class"""
@@ -20,7 +169,10 @@ class VexaAgent:
         self, 
         model_name: str = None,
         tools: List[Tool] = None,
-        verbose: bool = None
+        verbose: bool = None,
+        preload: bool = True,
+        cache_ttl: float = None,
+        allow_batch_tools: bool = False
     ):
         """
         Initialize the VEXA Agent
@@ -29,10 +181,28 @@ class VexaAgent:
             model_name: Name of the Ollama model to use
             tools: List of tools for the agent
             verbose: Whether to show verbose output
+            preload: Whether to load the model into Ollama during init
+            cache_ttl: Seconds to reuse identical query responses (0 disables caching)
+            allow_batch_tools: Also register tools that take a list of inputs (web_search_batch)
         """
         self.model_name = model_name or VexaConfig.DEFAULT_MODEL
         self.verbose = verbose if verbose is not None else VexaConfig.VERBOSE
-        self.tools = tools or VexaTools.get_default_tools()
+        self.tools = list(tools or VexaTools.get_default_tools())
+        if allow_batch_tools and not any(t.name == "web_search_batch" for t in self.tools):
+            self.tools.append(VexaTools.get_web_search_batch_tool())
+        self.preload = preload
+        self.preloaded = False
+        
+        # Response cache: key -> (timestamp, response)
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_ttl = VexaConfig.RESPONSE_CACHE_TTL if cache_ttl is None else cache_ttl
+        
+        # Recent tool observations, fed back into later queries
+        self._turn_history: deque = deque(maxlen=VexaConfig.OBSERVATION_HISTORY)
+        
+        # Event loop for query_batch; Ollama's async client is bound to the
+        # loop it was first used on, so every batch has to run on the same one
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Validate model
         if not VexaConfig.validate_model(self.model_name):
@@ -47,70 +217,73 @@ class VexaAgent:
     def _initialize_agent(self) -> None:
         """Initialize the LLM and agent"""
         try:
-            # Initialize the LLM
-            model_config = VexaConfig.get_model_config(self.model_name)
-            self.llm = OllamaLLM(**model_config)
-            
-            # Create the prompt template
-            prompt = self._create_prompt_template()
-            
-            # Create the agent
-            self.agent = create_react_agent(self.llm, self.tools, prompt)
-            
-            # Create the agent executor
-            agent_config = VexaConfig.get_agent_config()
-            # Remove verbose from agent_config since it's passed separately
-            agent_config_clean = {k: v for k, v in agent_config.items() if k != 'verbose'}
-            
-            self.agent_executor = AgentExecutor(
-                agent=self.agent,
-                tools=self.tools,
-                verbose=self.verbose,
-                **agent_config_clean
-            )
-            
+            self._build_llm()
+            self._build_executor()
         except Exception as e:
             logging.error(f"Failed to initialize agent: {e}")
             raise
+        
+        if self.preload:
+            self.preloaded = self._preload_model()
+    
+    def _build_llm(self) -> None:
+        """Create the Ollama LLM client"""
+        from langchain_ollama import OllamaLLM
+        
+        model_config = VexaConfig.get_model_config(self.model_name)
+        self.llm = OllamaLLM(**model_config)
+    
+    def _build_executor(self) -> None:
+        """Create the ReAct agent and executor around the existing LLM"""
+        from langchain.agents import create_react_agent, AgentExecutor
+        
+        # Create the prompt template
+        prompt = self._create_prompt_template()
+        
+        # Create the agent
+        self.agent = create_react_agent(self.llm, self.tools, prompt)
+        
+        # Create the agent executor
+        # Remove verbose from agent_config since it's passed separately
+        agent_config_clean = {k: v for k, v in AGENT_CONFIG.items() if k != 'verbose'}
+        
+        self.agent_executor = AgentExecutor(
+            agent=self.agent,
+            tools=self.tools,
+            verbose=self.verbose,
+            **agent_config_clean
+        )
+    
+    def _preload_model(self) -> bool:
+        """Load the model into Ollama with an empty prompt so the first query doesn't pay for it"""
+        try:
+            self.llm.invoke("", stop=["\n"])
+            return True
+        except Exception as e:
+            logging.warning(f"Failed to preload model {self.model_name}: {e}")
+            return False
+    
+    def keep_warm(self) -> bool:
+        """Refresh Ollama's keep_alive timer so the model isn't unloaded while idle"""
+        return self._preload_model()
     
     def _create_prompt_template(self) -> PromptTemplate:
         """Create a custom prompt template for the ReAct agent"""
-        template = """You are VEXA, a helpful and intelligent AI assistant. You have access to various tools to help answer questions and perform tasks.
-
-You have access to the following tools:
-{tools}
-
-Use the following format:
-
-Question: the input question you must answer
-Thought: you should always think about what to do
-Action: the action to take, should be one of [{tool_names}]
-Action Input: the input to the action
-Observation: the result of the action
-... (this Thought/Action/Action Input/Observation can repeat N times)
-Thought: I now know the final answer
-Final Answer: the final answer to the original input question
-
-Important guidelines:
-- Be helpful, accurate, and concise in your responses
-- Use tools when you need current information or to perform specific tasks
-- If you can answer directly without tools, feel free to do so
-- Always provide the most accurate and up-to-date information possible
-- If you're unsure about something, say so rather than guessing
-
-Begin!
-
-Question: {input}
-Thought:{agent_scratchpad}"""
-
-        return PromptTemplate.from_template(template)
+        return _get_prompt()
     
-    def query(self, question: str) -> Dict[str, Any]:
+    def query(
+        self,
+        question: str,
+        bypass_cache: bool = False,
+        use_history: bool = True
+    ) -> Dict[str, Any]:
         """
         Process a query and return the response
         
         Args:
             question: The user's question or request
+            bypass_cache: Always run the agent, ignoring cached responses
+            use_history: Share recent tool observations with this query
             
         Returns:
             Dictionary containing the response and metadata
@@ -118,42 +291,329 @@ Thought:{agent_scratchpad}"""
         if not self.agent_executor:
             raise RuntimeError("Agent not properly initialized")
         
+        fast = self._fast_path(question)
+        if fast is not None:
+            return fast
+        
+        cache_key = self._cache_key(question, use_history)
+        if not bypass_cache:
+            cached = self._cache_get(cache_key, question)
+            if cached is not None:
+                return cached
+        
         try:
             # Execute the query
-            response = self.agent_executor.invoke({"input": question})
+            agent_input = self._build_input(question) if use_history else question
+            response = self.agent_executor.invoke({"input": agent_input})
+            if use_history:
+                self._remember_steps(response.get("intermediate_steps", []))
+            result = self._format_response(question, response)
+            self._cache_put(cache_key, result)
+            return result
             
-            return {
-                "success": True,
-                "response": response.get("output", "No response generated"),
-                "input": question,
-                "model": self.model_name,
-                "tools_used": self._extract_tools_used(response)
-            }
+        except Exception as e:
+            return self._format_error(question, e)
+    
+    def stream_query(
+        self,
+        question: str,
+        on_retract: Optional[Callable[[], None]] = None
+    ) -> Iterator[str]:
+        """
+        Process a query and yield the answer as it becomes available
+        
+        Intermediate ReAct steps are not yielded. With on_retract, final answer
+        tokens are yielded as the model generates them; if the model then turns
+        that answer into an Action step, on_retract is called and the text
+        yielded so far should be discarded before the real answer follows.
+        Without on_retract, an answer is only yielded once its generation has
+        finished and parsed as a final answer.
+        
+        Args:
+            question: The user's question or request
+            on_retract: Called when already-yielded text turned out not to be the answer
+            
+        Yields:
+            Chunks of the final answer
+        """
+        if not self.agent_executor:
+            raise RuntimeError("Agent not properly initialized")
+        
+        cache_key = self._cache_key(question)
+        cached = self._fast_path(question) or self._cache_get(cache_key, question)
+        if cached is not None:
+            yield cached["response"]
+            return
+        
+        # The executor runs in a worker thread and hands tokens over through a queue
+        tokens: queue.Queue = queue.Queue()
+        outcome: Dict[str, Any] = {}
+        retract = (lambda: tokens.put(_RETRACT)) if on_retract else None
+        
+        def _run() -> None:
+            try:
+                outcome["response"] = self.agent_executor.invoke(
+                    {"input": self._build_input(question)},
+                    config={"callbacks": [_make_final_answer_streamer(tokens.put, retract)]}
+                )
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                tokens.put(None)
+        
+        threading.Thread(target=_run, name="vexa-stream", daemon=True).start()
+        
+        streamed = False
+        for token in iter(tokens.get, None):
+            if token is _RETRACT:
+                on_retract()
+                streamed = False
+                continue
+            if token:
+                streamed = True
+                yield token
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        
+        response = outcome["response"]
+        self._remember_steps(response.get("intermediate_steps", []))
+        result = self._format_response(question, response)
+        self._cache_put(cache_key, result)
+        if not streamed:
+            # The answer didn't come from a streamed "Final Answer:" (e.g. a non-streaming LLM)
+            yield result["response"]
+    
+    async def aquery(
+        self,
+        question: str,
+        bypass_cache: bool = False,
+        use_history: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Process a query asynchronously and return the response
+        
+        Args:
+            question: The user's question or request
+            bypass_cache: Always run the agent, ignoring cached responses
+            use_history: Share recent tool observations with this query
+            
+        Returns:
+            Dictionary containing the response and metadata
+        """
+        if not self.agent_executor:
+            raise RuntimeError("Agent not properly initialized")
+        
+        fast = self._fast_path(question)
+        if fast is not None:
+            return fast
+        
+        cache_key = self._cache_key(question, use_history)
+        if not bypass_cache:
+            cached = self._cache_get(cache_key, question)
+            if cached is not None:
+                return cached
+        
+        try:
+            agent_input = self._build_input(question) if use_history else question
+            response = await self.agent_executor.ainvoke({"input": agent_input})
+            if use_history:
+                self._remember_steps(response.get("intermediate_steps", []))
+            result = self._format_response(question, response)
+            self._cache_put(cache_key, result)
+            return result
             
         except Exception as e:
-            error_msg = f"Error processing query: {str(e)}"
-            if self.verbose:
-                error_msg += f"\nTraceback: {traceback.format_exc()}"
+            return self._format_error(question, e)
+    
+    async def aquery_batch(
+        self,
+        questions: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several queries concurrently
+        
+        Queries are admitted shortest-first into max_concurrency slots, and a
+        slot takes the next pending query as soon as its current one finishes,
+        so a long query never holds short ones back.
+        
+        Args:
+            questions: The questions to answer
+            max_concurrency: Maximum in-flight requests (defaults to OLLAMA_NUM_PARALLEL)
             
-            logging.error(error_msg)
+        Returns:
+            List of response dictionaries, in the same order as questions
+        """
+        limit = max(1, max_concurrency or VexaConfig.OLLAMA_NUM_PARALLEL)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        
+        pending: asyncio.Queue = asyncio.Queue()
+        for index in sorted(range(len(questions)), key=lambda i: len(questions[i])):
+            pending.put_nowait(index)
+        
+        async def _slot() -> None:
+            while not pending.empty():
+                index = pending.get_nowait()
+                # Batch questions are independent, so don't share observations
+                results[index] = await self.aquery(questions[index], use_history=False)
+        
+        await asyncio.gather(*[_slot() for _ in range(min(limit, len(questions)))])
+        return results
+    
+    def query_batch(
+        self,
+        questions: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous wrapper around aquery_batch"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        elif self._loop.is_closed():
+            # The Ollama async client can't move to a new loop
+            raise RuntimeError("Agent is closed")
+        return self._loop.run_until_complete(self.aquery_batch(questions, max_concurrency))
+    
+    def close(self) -> None:
+        """Close the event loop used by query_batch"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+    
+    def __enter__(self) -> VexaAgent:
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _fast_path(self, question: str) -> Optional[Dict[str, Any]]:
+        """Answer a trivial query with a single direct tool call, skipping the LLM"""
+        if not VexaConfig.FAST_PATH:
+            return None
+        
+        for pattern, tool_name, make_input in _FAST_ROUTES:
+            match = pattern.match(question)
+            if not match:
+                continue
+            tool = next((t for t in self.tools if t.name == tool_name), None)
+            if tool is None:
+                return None
+            try:
+                output = tool.func(make_input(match))
+            except Exception as e:
+                logging.debug(f"Fast path {tool_name} failed, using agent: {e}")
+                return None
+            # Tools report failures as "Error ..." strings rather than raising
+            if str(output).startswith("Error"):
+                logging.debug(f"Fast path {tool_name} failed, using agent: {output}")
+                return None
             return {
-                "success": False,
-                "response": "I encountered an error while processing your request. Please try rephrasing your question or check if Ollama is running with the correct model.",
-                "error": str(e),
+                "success": True,
+                "response": output,
                 "input": question,
-                "model": self.model_name
+                "model": self.model_name,
+                "tools_used": [tool_name],
+                "fast_path": True
             }
+        return None
+    
+    def _build_input(self, question: str) -> str:
+        """Prepend recent tool observations to the question"""
+        if not self._turn_history:
+            return question
+        recent = "\n".join(self._turn_history)
+        return f"Recent observations:\n{recent}\n\n{question}"
+    
+    def _remember_steps(self, steps: List) -> None:
+        """Record tool observations from a finished run"""
+        for step in steps:
+            action, observation = step if isinstance(step, tuple) else (step.action, step.observation)
+            tool = getattr(action, "tool", "")
+            if not tool or tool == "_Exception":
+                continue
+            text = " ".join(str(observation).split())[:200]
+            self._turn_history.append(f"- {tool}({getattr(action, 'tool_input', '')}): {text}")
+    
+    def _cache_key(self, question: str, use_history: bool = True) -> Optional[str]:
+        """
+        Get the cache key for a question, or None if it shouldn't be cached
+        
+        Computed before the run: the observations _build_input prepends are part
+        of the key, and the run itself adds new ones.
+        """
+        if self._cache_ttl <= 0 or _TIME_SENSITIVE_RE.search(question):
+            return None
+        tool_names = ",".join(tool.name for tool in self.tools)
+        history = "\n".join(self._turn_history) if use_history else ""
+        normalized = " ".join(question.lower().split())
+        return hashlib.sha1(f"{self.model_name}|{tool_names}|{history}|{normalized}".encode()).hexdigest()
+    
+    def _cache_get(self, key: Optional[str], question: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response that hasn't expired yet"""
+        if key is None or key not in self._cache:
+            return None
+        
+        stored_at, result = self._cache[key]
+        if time.time() - stored_at > self._cache_ttl:
+            del self._cache[key]
+            return None
+        return dict(result, input=question, cached=True)
+    
+    def _cache_put(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        """Store a successful response, evicting the oldest entry when full"""
+        if key is None or not result.get("success"):
+            return
+        if _UNCACHEABLE_TOOLS.intersection(result.get("tools_used", ())):
+            return
+        
+        self._cache.pop(key, None)
+        if len(self._cache) >= VexaConfig.RESPONSE_CACHE_SIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.time(), result)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached responses"""
+        self._cache.clear()
+    
+    def _format_response(self, question: str, response: Dict) -> Dict[str, Any]:
+        """Build the standard success response dictionary"""
+        return {
+            "success": True,
+            "response": response.get("output", "No response generated"),
+            "input": question,
+            "model": self.model_name,
+            "tools_used": self._extract_tools_used(response)
+        }
+    
+    def _format_error(self, question: str, e: Exception) -> Dict[str, Any]:
+        """Build the standard error response dictionary"""
+        error_msg = f"Error processing query: {str(e)}"
+        if self.verbose:
+            error_msg += f"\nTraceback: {traceback.format_exc()}"
+        
+        logging.error(error_msg)
+        return {
+            "success": False,
+            "response": "I encountered an error while processing your request. Please try rephrasing your question or check if Ollama is running with the correct model.",
+            "error": str(e),
+            "input": question,
+            "model": self.model_name
+        }
     
     def _extract_tools_used(self, response: Dict) -> List[str]:
-        """Extract which tools were used in the response"""
-        # This is a simplified implementation
-        # In practice, you might want to parse the intermediate steps
-        return []
+        """Extract which tools were used in the response, in first-use order"""
+        tools_used: List[str] = []
+        for step in response.get("intermediate_steps", []):
+            action = step[0] if isinstance(step, tuple) else step.action
+            tool = getattr(action, "tool", "")
+            if tool and tool != "_Exception" and tool not in tools_used:
+                tools_used.append(tool)
+        return tools_used
     
     def add_tool(self, tool: Tool) -> None:
         """Add a new tool to the agent"""
         self.tools.append(tool)
-        self._initialize_agent()  # Reinitialize with new tools
+        self._build_executor()  # Rebuild with new tools, keeping the loaded LLM
     
     def list_tools(self) -> str:
         """Get a list of available tools"""
@@ -168,30 +628,70 @@ Thought:{agent_scratchpad}"""
             "tools": [tool.name for tool in self.tools]
         }
     
-    def health_check(self) -> Dict[str, Any]:
-        """Perform a health check on the agent"""
+    def health_check(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Perform a health check on the agent
+        
+        Args:
+            deep: Also run a test query through the full agent (slow)
+            
+        Returns:
+            Dictionary with the health status
+        """
+        base_url = VexaConfig.get_ollama_url(getattr(self.llm, "base_url", None))
         try:
-            # Try a simple query
-            test_response = self.query("Say hello")
-            return {
-                "status": "healthy" if test_response["success"] else "unhealthy",
+            # Ask Ollama which models it has instead of generating text
+            resp = requests.get(f"{base_url}/api/tags", timeout=VexaConfig.HEALTH_CHECK_TIMEOUT)
+            resp.raise_for_status()
+            names = {m.get("name", "") for m in resp.json().get("models", [])}
+            model_available = self.model_name in names or f"{self.model_name}:latest" in names
+            
+            result = {
+                "status": "healthy" if model_available else "unhealthy",
                 "model": self.model_name,
                 "tools_count": len(self.tools),
-                "test_query_success": test_response["success"]
+                "ollama_reachable": True,
+                "model_available": model_available
             }
+            if not model_available:
+                result["error"] = f"Model {self.model_name} not found in Ollama. Run: ollama pull {self.model_name}"
+                return result
+            
+            result["loaded_models"] = self._loaded_models(base_url)
+            
+            if deep:
+                test_response = self.query("Say hello")
+                result["test_query_success"] = test_response["success"]
+                if not test_response["success"]:
+                    result["status"] = "unhealthy"
+                    result["error"] = test_response.get("error", "Test query failed")
+            return result
         except Exception as e:
             return {
                 "status": "unhealthy",
                 "error": str(e),
                 "model": self.model_name,
-                "tools_count": len(self.tools)
+                "tools_count": len(self.tools),
+                "ollama_reachable": False
             }
+    
+    def _loaded_models(self, base_url: str) -> List[str]:
+        """Get the models currently resident in Ollama (like `ollama ps`)"""
+        try:
+            resp = requests.get(f"{base_url}/api/ps", timeout=VexaConfig.HEALTH_CHECK_TIMEOUT)
+            resp.raise_for_status()
+            return [m.get("name", "") for m in resp.json().get("models", [])]
+        except Exception:
+            return []
 
 
 def create_vexa_agent(
     model_name: str = None,
     custom_tools: List[Tool] = None,
-    verbose: bool = None
+    verbose: bool = None,
+    preload: bool = True,
+    cache_ttl: float = None,
+    allow_batch_tools: bool = False
 ) -> VexaAgent:
     """
     Factory function to create a VEXA agent
@@ -200,16 +700,22 @@ def create_vexa_agent(
         model_name: Ollama model name
         custom_tools: Custom tools to add
         verbose: Verbose output
+        preload: Load the model into Ollama during init
+        cache_ttl: Seconds to reuse identical query responses (0 disables caching)
+        allow_batch_tools: Register batch tools such as web_search_batch
         
     Returns:
         Configured VexaAgent instance
     """
-    tools = VexaTools.get_default_tools()
+    tools = list(VexaTools.get_default_tools())
     if custom_tools:
         tools.extend(custom_tools)
     
     return VexaAgent(
         model_name=model_name,
         tools=tools,
-        verbose=verbose
+        verbose=verbose,
+        preload=preload,
+        cache_ttl=cache_ttl,
+        allow_batch_tools=allow_batch_tools
     )
@@ -0,0 +1,56 @@
+"""
+Keyword dispatch shared by the demo and simple (no-LLM) modes
+
+Matches every keyword group in a single pass over the text, using
+pyahocorasick or google-re2 when installed and a combined regex otherwise.
+"""
+import re
+
+try:
+    import ahocorasick  # Optional: pyahocorasick finds all keywords in one C-level pass
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # Optional: google-re2 matches all keyword groups in one DFA scan
+except ImportError:
+    re2 = None
+
+
+def compile_keyword_dispatch(keyword_groups):
+    """Build a function that returns the index of the first category matching a text, or None"""
+    if ahocorasick is not None:
+        # Aho-Corasick automaton over every keyword, valued by its category
+        automaton = ahocorasick.Automaton()
+        for category, words in enumerate(keyword_groups):
+            for word in words:
+                if word not in automaton:
+                    automaton.add_word(word, category)
+        automaton.make_automaton()
+        
+        def match(text):
+            return min((category for _, category in automaton.iter(text)), default=None)
+        return match
+    
+    patterns = ["|".join(re.escape(word) for word in words) for words in keyword_groups]
+    
+    if re2 is not None:
+        # One scan reports every matching category
+        keyword_set = re2.Set.SearchSet(re2.Options())
+        for pattern in patterns:
+            keyword_set.Add(pattern)
+        keyword_set.Compile()
+        
+        def match(text):
+            ids = keyword_set.Match(text)
+            return min(ids) if ids else None
+        return match
+    
+    # Fallback: one alternation, each category in its own named group. The
+    # lookahead is zero-width, so finditer tries every start position and
+    # overlapping keywords from different categories are all seen
+    combined = re.compile("(?=" + "|".join(f"(?P<c{i}>{p})" for i, p in enumerate(patterns)) + ")")
+    
+    def match(text):
+        return min((int(m.lastgroup[1:]) for m in combined.finditer(text)), default=None)
+    return match
@@ -1,14 +1,163 @@
 """
 Custom tools for the VEXA AI Agent
+
+LangChain is imported inside the tool builders so that importing this module
+(e.g. for list_available_tools) stays cheap.
 """
-from langchain_core.tools import Tool
-from langchain_community.tools import DuckDuckGoSearchRun
-from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
-from typing import List
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import ast
 import datetime
+import functools
 import math
 import json
-import requests
+import operator
+import os
+import re
+
+from .config import VexaConfig
+
+if TYPE_CHECKING:
+    from langchain_core.tools import Tool
+    from langchain_community.tools import DuckDuckGoSearchRun
+
+
+# Shared DuckDuckGo client and search tool, created on first use
+_DDGS_CLIENT = None
+_SEARCH: Optional[DuckDuckGoSearchRun] = None
+
+
+def _get_ddgs_client():
+    """Get the shared DDGS client so its HTTP connections are reused across searches"""
+    global _DDGS_CLIENT
+    if _DDGS_CLIENT is None:
+        try:
+            from ddgs import DDGS  # Package name used by newer langchain-community
+        except ImportError:
+            from duckduckgo_search import DDGS
+        _DDGS_CLIENT = DDGS(timeout=VexaConfig.SEARCH_TIMEOUT)
+    return _DDGS_CLIENT
+
+
+def _get_search() -> DuckDuckGoSearchRun:
+    """Get the shared DuckDuckGo search runner"""
+    global _SEARCH
+    if _SEARCH is None:
+        from langchain_community.tools import DuckDuckGoSearchRun
+        from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
+        
+        class _PersistentDuckDuckGoSearchAPIWrapper(DuckDuckGoSearchAPIWrapper):
+            """DuckDuckGo wrapper that reuses one DDGS client instead of opening a new one per search"""
+            
+            def _ddgs_text(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, str]]:
+                results = _get_ddgs_client().text(
+                    query,
+                    region=self.region,
+                    safesearch=self.safesearch,
+                    timelimit=self.time,
+                    max_results=max_results or self.max_results,
+                    backend=self.backend,
+                )
+                return list(results) if results else []
+        
+        _SEARCH = DuckDuckGoSearchRun(api_wrapper=_PersistentDuckDuckGoSearchAPIWrapper())
+    return _SEARCH
+
+
+# Any character outside digits, letters (function names), operators, parentheses,
+# commas and whitespace; _evaluate does the real filtering
+_INVALID_CALC_CHARS = re.compile(r"[^0-9A-Za-z+\-*/%().,\s]")
+
+# Which part of the current date/time a datetime query asks for
+_DATETIME_KIND = re.compile(r"\b(date|time)", re.I)
+_now = datetime.datetime.now
+_DATE_FMT = '%Y-%m-%d'
+_TIME_FMT = '%H:%M:%S'
+_DATETIME_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Operators a calculator expression may use
+_CALC_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_CALC_UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+
+# Largest integer (in bits) a calculation may produce, so inputs like
+# 9**9**9 fail fast instead of pinning the CPU
+_CALC_MAX_BITS = 4096
+
+
+def _round(number, ndigits=None):
+    """round() with a bounded precision (round(5, -10**8) builds a huge 10**n)"""
+    if ndigits is not None and abs(ndigits) > 100:
+        raise ValueError("round() precision must be between -100 and 100")
+    return round(number, ndigits)
+
+
+# math members calculator expressions may use, as math.<name> or just <name>;
+# functions like factorial and comb are left out because they can run for minutes
+_CALC_MATH = {
+    name: getattr(math, name) for name in (
+        "sqrt", "exp", "log", "log2", "log10",
+        "sin", "cos", "tan", "asin", "acos", "atan", "atan2",
+        "sinh", "cosh", "tanh", "degrees", "radians",
+        "floor", "ceil", "fabs", "hypot",
+        "pi", "e", "tau",
+    )
+}
+
+# Names visible to calculator expressions
+_CALC_NAMES = {**_CALC_MATH, "abs": abs, "round": _round}
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse a calculator expression (cached per expression)"""
+    return ast.parse(expression.strip(), mode="eval").body
+
+
+def _evaluate(node: ast.expr):
+    """Evaluate a parsed calculator expression, allowing only whitelisted syntax and names"""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if type(value) not in (int, float):
+            raise ValueError(f"Unsupported constant: {value!r}")
+    elif isinstance(node, ast.Name):
+        if node.id not in _CALC_NAMES:
+            raise ValueError(f"Unknown name: {node.id}")
+        value = _CALC_NAMES[node.id]
+    elif isinstance(node, ast.Attribute):
+        if not (isinstance(node.value, ast.Name) and node.value.id == "math" and node.attr in _CALC_MATH):
+            raise ValueError(f"Unsupported attribute: {node.attr}")
+        value = _CALC_MATH[node.attr]
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in _CALC_UNARY_OPS:
+        value = _CALC_UNARY_OPS[type(node.op)](_evaluate(node.operand))
+    elif isinstance(node, ast.BinOp) and type(node.op) in _CALC_BIN_OPS:
+        left, right = _evaluate(node.left), _evaluate(node.right)
+        # Estimate integer powers before computing them (to within 2x); other
+        # operators can at most double the size of operands within the limit
+        if (isinstance(node.op, ast.Pow) and isinstance(left, int) and isinstance(right, int)
+                and right > 0 and (left.bit_length() - 1) * right > _CALC_MAX_BITS):
+            raise ValueError("Result is too large")
+        value = _CALC_BIN_OPS[type(node.op)](left, right)
+    elif isinstance(node, ast.Call) and isinstance(node.func, (ast.Name, ast.Attribute)) and not node.keywords:
+        func = _evaluate(node.func)
+        if not callable(func):
+            raise ValueError(f"{ast.unparse(node.func)} is not a function")
+        value = func(*[_evaluate(arg) for arg in node.args])
+    else:
+        raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+    
+    if isinstance(value, int) and value.bit_length() > _CALC_MAX_BITS:
+        raise ValueError("Result is too large")
+    return value
 
 
 class VexaTools:
@@ -17,13 +166,57 @@ class VexaTools:
     @staticmethod
     def get_web_search_tool() -> Tool:
         """Web search tool using DuckDuckGo"""
-        search = DuckDuckGoSearchRun()
+        search = _get_search()
+        from langchain_core.tools import Tool
         return Tool(
             name="web_search",
             func=search.run,
             description="Useful for searching the web for current information, news, facts, and answers. Input should be a search query string."
         )
     
+    @staticmethod
+    def get_web_search_batch_tool() -> Tool:
+        """Web search tool that runs several independent queries concurrently"""
+        def search_batch(queries: str) -> str:
+            """Run a JSON list of search queries in parallel"""
+            usage = "Error: Provide a JSON list of search queries, e.g. [\"query one\", \"query two\"]"
+            try:
+                parsed = json.loads(queries)
+                if isinstance(parsed, str):
+                    parsed = [parsed]
+            except json.JSONDecodeError:
+                parsed = queries.splitlines()
+            
+            # Numbers, null and objects are valid JSON but not queries
+            if not isinstance(parsed, list) or not all(isinstance(q, str) for q in parsed):
+                return usage
+            
+            query_list = [q.strip() for q in parsed if q.strip()]
+            if not query_list:
+                return usage
+            if len(query_list) > VexaConfig.SEARCH_BATCH_LIMIT:
+                return f"Error: At most {VexaConfig.SEARCH_BATCH_LIMIT} queries per batch."
+            
+            search = _get_search()
+            
+            def run_one(query: str) -> str:
+                try:
+                    return search.run(query)
+                except Exception as e:
+                    return f"Error searching '{query}': {str(e)}"
+            
+            # All searches share the DDGS client's connection pool
+            with ThreadPoolExecutor(max_workers=len(query_list)) as pool:
+                results = list(pool.map(run_one, query_list))
+            return "\n\n".join(f"[{q}]\n{r}" for q, r in zip(query_list, results))
+        
+        from langchain_core.tools import Tool
+        return Tool(
+            name="web_search_batch",
+            func=search_batch,
+            description="Search the web for several independent queries at once. Input should be a JSON list of search query strings. When you have multiple independent search subqueries, call web_search_batch once with a list instead of calling web_search several times."
+        )
+    
     @staticmethod
     def get_calculator_tool() -> Tool:
         """Calculator tool for mathematical operations"""
@@ -31,20 +224,20 @@ class VexaTools:
             """Safely evaluate mathematical expressions"""
             try:
                 # Remove any potentially dangerous operations
-                allowed_chars = set('0123456789+-*/().** ')
-                if not all(c in allowed_chars for c in expression.replace(' ', '')):
-                    return "Error: Invalid characters in expression. Only numbers and basic math operators (+, -, *, /, **, ()) are allowed."
+                if _INVALID_CALC_CHARS.search(expression):
+                    return "Error: Invalid characters in expression. Only numbers, math functions and basic math operators (+, -, *, /, **, %, ()) are allowed."
                 
                 # Evaluate the expression safely
-                result = eval(expression, {"__builtins__": {}}, {"math": math})
+                result = _evaluate(_parse_expression(expression))
                 return f"Result: {result}"
             except Exception as e:
                 return f"Error calculating '{expression}': {str(e)}"
         
+        from langchain_core.tools import Tool
         return Tool(
             name="calculator",
             func=calculate,
-            description="Useful for performing mathematical calculations. Input should be a mathematical expression like '2+2' or 'sqrt(16)'. Supports basic operations: +, -, *, /, **, ()."
+            description="Useful for performing mathematical calculations. Input should be a mathematical expression like '2+2' or 'sqrt(16)'. Supports basic operations (+, -, *, /, **, %, ()), abs, round, pi, e and common math functions such as sqrt, log and sin (also as math.log)."
         )
     
     @staticmethod
@@ -52,15 +245,18 @@ class VexaTools:
         """Tool for getting current date and time information"""
         def get_datetime_info(query: str = "") -> str:
             """Get current date/time information"""
-            now = datetime.datetime.now()
+            now = _now()
+            match = _DATETIME_KIND.search(query)
+            kind = match.group(1).lower() if match else None
             
-            if "date" in query.lower():
-                return f"Current date: {now.strftime('%Y-%m-%d')}"
-            elif "time" in query.lower():
-                return f"Current time: {now.strftime('%H:%M:%S')}"
+            if kind == "date":
+                return f"Current date: {now.strftime(_DATE_FMT)}"
+            elif kind == "time":
+                return f"Current time: {now.strftime(_TIME_FMT)}"
             else:
-                return f"Current date and time: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+                return f"Current date and time: {now.strftime(_DATETIME_FMT)}"
         
+        from langchain_core.tools import Tool
         return Tool(
             name="datetime",
             func=get_datetime_info,
@@ -78,6 +274,7 @@ class VexaTools:
             except Exception as e:
                 return f"Error getting weather for {location}: {str(e)}"
         
+        from langchain_core.tools import Tool
         return Tool(
             name="weather",
             func=get_weather,
@@ -91,50 +288,65 @@ class VexaTools:
             """Perform basic file operations"""
             try:
                 if operation.startswith("list"):
-                    import os
                     path = operation.replace("list ", "").strip() or "."
-                    files = os.listdir(path)
-                    return f"Files in '{path}': {', '.join(files[:10])}{'...' if len(files) > 10 else ''}"
+                    # Stop reading the directory once we have enough names
+                    names = []
+                    more = False
+                    with os.scandir(path) as entries:
+                        for entry in entries:
+                            if len(names) >= 10:
+                                more = True
+                                break
+                            names.append(entry.name)
+                    return f"Files in '{path}': {', '.join(names)}{'...' if more else ''}"
                 elif operation.startswith("pwd"):
-                    import os
                     return f"Current directory: {os.getcwd()}"
                 else:
                     return "Supported operations: 'list [path]' to list files, 'pwd' for current directory"
             except Exception as e:
                 return f"Error with file operation '{operation}': {str(e)}"
         
+        from langchain_core.tools import Tool
         return Tool(
             name="file_ops",
             func=file_operations,
             description="Basic file operations. Use 'list' to list files in current directory, 'list [path]' for specific directory, or 'pwd' for current working directory."
         )
     
-    @classmethod
-    def get_default_tools(cls) -> List[Tool]:
-        """Get the default set of tools for the agent"""
-        return [
-            cls.get_web_search_tool(),
-            cls.get_calculator_tool(),
-            cls.get_datetime_tool(),
-            cls.get_file_operations_tool(),
-        ]
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_default_tools() -> Tuple[Tool, ...]:
+        """
+        Get the default set of tools for the agent
+        
+        The tools are built once and shared, so the result is an immutable
+        tuple; use list(...) to get a list you can add tools to.
+        """
+        return (
+            VexaTools.get_web_search_tool(),
+            VexaTools.get_calculator_tool(),
+            VexaTools.get_datetime_tool(),
+            VexaTools.get_file_operations_tool(),
+        )
     
-    @classmethod
-    def get_all_tools(cls) -> List[Tool]:
-        """Get all available tools"""
-        return [
-            cls.get_web_search_tool(),
-            cls.get_calculator_tool(),
-            cls.get_datetime_tool(),
-            cls.get_weather_tool(),
-            cls.get_file_operations_tool(),
-        ]
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_all_tools() -> Tuple[Tool, ...]:
+        """Get all available tools (shared, immutable tuple like get_default_tools)"""
+        return (
+            VexaTools.get_web_search_tool(),
+            VexaTools.get_calculator_tool(),
+            VexaTools.get_datetime_tool(),
+            VexaTools.get_weather_tool(),
+            VexaTools.get_file_operations_tool(),
+        )
     
     @classmethod
     def list_available_tools(cls) -> str:
         """Get a formatted list of available tools"""
         tools_info = [
             "🔍 web_search - Search the web for information",
+            "🔎 web_search_batch - Run several web searches at once (opt-in)",
             "🧮 calculator - Perform mathematical calculations", 
             "📅 datetime - Get current date and time",
             "📁 file_ops - Basic file operations",
@@ -10,27 +10,60 @@ Examples:
     python run_agent.py --model llama2     # Use specific model
     python run_agent.py --verbose          # Enable verbose mode
     python run_agent.py --tools-info       # Show available tools
+    python run_agent.py -q "2+2" -q "Hi"   # Batch queries (concurrent)
+    python run_agent.py --serve            # Keep an agent resident for --query
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
+import json
+import socket
+import stat
 import sys
+import threading
 import os
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 # Add parent directory to path to import agent module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from agent import VexaAgent, create_vexa_agent, VexaConfig
+# Only the lightweight config is imported up front; the agent (and LangChain)
+# is loaded when actually needed
+from agent import VexaConfig
+
+if TYPE_CHECKING:
+    from agent import VexaAgent
 
 
 class VexaCLI:
     """Command-line interface for VEXA Agent"""
     
-    def __init__(self, model_name: str = None, verbose: bool = False):
+    def __init__(
+        self,
+        model_name: str = None,
+        verbose: bool = False,
+        deep_health: bool = False,
+        use_cache: bool = True,
+        socket_path: str = None
+    ):
         """Initialize CLI with agent"""
         self.model_name = model_name or VexaConfig.DEFAULT_MODEL
         self.verbose = verbose
+        self.deep_health = deep_health
+        self.use_cache = use_cache
+        self.socket_path = socket_path or VexaConfig.SOCKET_PATH
+        # Options a running --serve process answers with its own settings instead
+        self._server_ignored = [
+            flag for flag, given in (
+                ("--model", model_name is not None),
+                ("--no-cache", not use_cache),
+                ("--verbose", verbose)
+            ) if given
+        ]
+        self._keep_warm_stop = threading.Event()
         self.agent: Optional[VexaAgent] = None
         
         # Setup logging
@@ -45,20 +78,30 @@ class VexaCLI:
         try:
             print(f"🔄 Initializing VEXA with model: {self.model_name}")
             print("   (Make sure Ollama is running with the specified model)")
+            hint = VexaConfig.get_ollama_tuning_hint()
+            if hint:
+                print(f"   💡 {hint}")
             
+            from agent import create_vexa_agent
             self.agent = create_vexa_agent(
                 model_name=self.model_name,
-                verbose=self.verbose
+                verbose=self.verbose,
+                cache_ttl=None if self.use_cache else 0
             )
             
-            # Perform health check
-            health = self.agent.health_check()
-            if health["status"] == "healthy":
-                print("✅ Agent initialized successfully!")
-                return True
-            else:
-                print(f"❌ Agent health check failed: {health.get('error', 'Unknown error')}")
+            if self.deep_health:
+                # Full test query through the agent
+                health = self.agent.health_check(deep=True)
+                if health["status"] != "healthy":
+                    print(f"❌ Agent health check failed: {health.get('error', 'Unknown error')}")
+                    return False
+            elif not self.agent.preloaded:
+                # The preload ping already loaded the model; no need for a test query
+                print(f"❌ Could not load model {self.model_name} in Ollama")
                 return False
+            
+            print("✅ Agent initialized successfully!")
+            return True
                 
         except Exception as e:
             print(f"❌ Failed to initialize agent: {e}")
@@ -102,6 +145,7 @@ class VexaCLI:
                 return
         
         self.show_welcome()
+        self._start_keep_warm()
         
         try:
             while True:
@@ -135,36 +179,225 @@ class VexaCLI:
                 print(f"\n🤖 Processing: {query}")
                 print("-" * 40)
                 
-                response = self.agent.query(query)
-                
-                if response["success"]:
-                    print(f"\n✅ VEXA: {response['response']}")
-                else:
-                    print(f"\n❌ Error: {response['response']}")
-                    if self.verbose and 'error' in response:
-                        print(f"Details: {response['error']}")
+                self._stream_response(query)
                 
         except Exception as e:
             print(f"\n❌ Unexpected error: {e}")
             if self.verbose:
                 import traceback
                 traceback.print_exc()
+        finally:
+            self._keep_warm_stop.set()
+    
+    def _start_keep_warm(self):
+        """Ping Ollama in the background so the model stays loaded between questions"""
+        self._keep_warm_stop.clear()
+        
+        def _keep_warm_loop():
+            while not self._keep_warm_stop.wait(VexaConfig.KEEP_WARM_INTERVAL):
+                self.agent.keep_warm()
+        
+        threading.Thread(target=_keep_warm_loop, name="vexa-keep-warm", daemon=True).start()
+    
+    def _stream_response(self, query: str):
+        """Print the agent's answer as it streams in"""
+        started = False
+        
+        def _retract():
+            # The model abandoned the answer it was writing; start a fresh one
+            nonlocal started
+            if started:
+                print("\n   ↩️  (revising answer)")
+                started = False
+        
+        try:
+            for chunk in self.agent.stream_query(query, on_retract=_retract):
+                if not started:
+                    print("\n✅ VEXA: ", end="", flush=True)
+                    started = True
+                print(chunk, end="", flush=True)
+            if started:
+                print()
+            else:
+                print("\n✅ VEXA: No response generated")
+        except Exception as e:
+            print("\n❌ Error: I encountered an error while processing your request. Please try rephrasing your question or check if Ollama is running with the correct model.")
+            if self.verbose:
+                print(f"Details: {e}")
     
     def run_single_query(self, query: str):
         """Run a single query and exit"""
-        if not self.agent:
+        # Prefer a running --serve process over starting a new agent
+        reply = send_to_server(self.socket_path, {"q": query})
+        if reply is not None:
+            self._warn_server_ignored()
+        elif not self.agent:
             if not self.initialize_agent():
                 return
         
         print(f"🤖 Query: {query}")
         print("-" * 50)
         
-        response = self.agent.query(query)
+        response = reply["response"] if reply is not None else self.agent.query(query)
+        self._print_response(response)
+    
+    def run_batch_queries(self, queries: List[str]):
+        """Run several queries concurrently and exit"""
+        reply = send_to_server(self.socket_path, {"queries": queries})
+        if reply is not None:
+            self._warn_server_ignored()
+        elif not self.agent:
+            if not self.initialize_agent():
+                return
+        
+        print(f"🤖 Running {len(queries)} queries")
+        print("-" * 50)
         
+        responses = reply["responses"] if reply is not None else self.agent.query_batch(queries)
+        for query, response in zip(queries, responses):
+            print(f"\n🤖 Query: {query}")
+            self._print_response(response)
+    
+    def close(self):
+        """Release the agent's resources"""
+        self._keep_warm_stop.set()
+        if self.agent:
+            self.agent.close()
+    
+    def _warn_server_ignored(self):
+        """Point out options that had no effect because a server answered"""
+        if self._server_ignored:
+            print(f"⚠️  Answered by the VEXA server on {self.socket_path}; "
+                  f"ignoring {', '.join(self._server_ignored)}")
+    
+    def _print_response(self, response: Dict[str, Any]):
+        """Print a query response"""
         if response["success"]:
             print(f"✅ Response: {response['response']}")
         else:
             print(f"❌ Error: {response['response']}")
+    
+    def serve(self):
+        """Keep an initialized agent resident and answer queries over a Unix socket"""
+        if not hasattr(asyncio, "start_unix_server"):
+            print("❌ Server mode requires Unix domain sockets, which this platform doesn't support")
+            return
+        
+        # Keep the model loaded for as long as the server runs
+        if "VEXA_KEEP_ALIVE" not in os.environ:
+            VexaConfig.KEEP_ALIVE = -1
+            VexaConfig.get_model_config.cache_clear()
+        
+        if not self.agent:
+            if not self.initialize_agent():
+                return
+        
+        try:
+            asyncio.run(self._serve_forever())
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped")
+        except OSError as e:
+            print(f"❌ Could not listen on {self.socket_path}: {e}")
+            return
+        
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+        self.close()
+    
+    async def _serve_forever(self):
+        """Run the Unix socket server until interrupted"""
+        socket_dir = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        
+        # Remove a socket left behind by a previous run, but never another user's
+        if os.path.lexists(self.socket_path):
+            if not _owned_by_current_user(os.lstat(self.socket_path)):
+                raise PermissionError(f"{self.socket_path} belongs to another user; use --socket to pick another path")
+            os.unlink(self.socket_path)
+        
+        # Create the socket owner-only from the start rather than chmod-ing it after bind
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+        finally:
+            os.umask(old_umask)
+        print(f"🚀 VEXA server listening on {self.socket_path}")
+        print(f"   Run: python app/run_agent.py --query \"...\" --socket {self.socket_path}")
+        
+        async with server:
+            await server.serve_forever()
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer one JSON request line from a client"""
+        try:
+            request = json.loads(await reader.readline())
+            if "queries" in request:
+                reply = {"responses": await self.agent.aquery_batch(request["queries"])}
+            else:
+                # Clients are independent, so observations aren't shared between them
+                reply = {"response": await self.agent.aquery(request["q"], use_history=False)}
+        except Exception as e:
+            reply = {"error": str(e)}
+        
+        writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+
+def _owned_by_current_user(st: os.stat_result) -> bool:
+    """Check a file's owner (always true on platforms without uids)"""
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def send_to_server(socket_path: str, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a request to a running --serve process; returns None if none is reachable"""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    
+    try:
+        st = os.lstat(socket_path)
+    except OSError:
+        return None
+    if not stat.S_ISSOCK(st.st_mode) or not _owned_by_current_user(st):
+        # Anyone can create a file at a shared path; only trust our own server
+        logging.warning(f"Ignoring {socket_path}: not a socket owned by the current user")
+        return None
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        reply = json.loads(data) if data else {}
+        if not isinstance(reply, dict):
+            raise ValueError("reply is not a JSON object")
+    except OSError:
+        return None
+    except ValueError:
+        logging.warning("VEXA server sent an incomplete reply")
+        return None
+    
+    if "error" in reply or not reply:
+        logging.warning(f"VEXA server error: {reply.get('error', 'empty reply')}")
+        return None
+    return reply
+
+
+def load_queries_file(path: str) -> List[str]:
+    """Read one query per line, skipping blank lines and # comments"""
+    with open(path, encoding="utf-8") as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
 
 
 def main():
@@ -177,13 +410,23 @@ Examples:
   python run_agent.py --model llama2     # Use specific model
   python run_agent.py --query "Hello"    # Single query mode
   python run_agent.py --tools-info       # Show available tools
+  python run_agent.py --queries-file q.txt  # Batch queries (concurrent)
+  python run_agent.py --serve            # Keep an agent resident; --query reuses it
+
+Environment:
+  OLLAMA_NUM_PARALLEL    Max concurrent batch queries (default: 4); should
+                         match the value `ollama serve` was started with
+  VEXA_NUM_CTX           Context window per request (default: 4096)
+  VEXA_NUM_PREDICT       Max tokens generated per request (default: 2048)
+  VEXA_KEEP_ALIVE        How long Ollama keeps the model loaded (default: 30m)
+  VEXA_SOCKET            Unix socket used by --serve and --query
+                         (default: $XDG_RUNTIME_DIR/vexa.sock)
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
     parser.add_argument(
         "--model", "-m",
-        default=VexaConfig.DEFAULT_MODEL,
         help=f"Ollama model to use (default: {VexaConfig.DEFAULT_MODEL})"
     )
     
@@ -195,7 +438,25 @@ Examples:
     
     parser.add_argument(
         "--query", "-q",
-        help="Run a single query and exit"
+        action="append",
+        help="Run a query and exit (repeat to run several concurrently)"
+    )
+    
+    parser.add_argument(
+        "--queries-file",
+        help="Run queries from a file (one per line) concurrently and exit"
+    )
+    
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep an initialized agent running and answer --query calls over a Unix socket"
+    )
+    
+    parser.add_argument(
+        "--socket",
+        default=VexaConfig.SOCKET_PATH,
+        help=f"Unix socket path for --serve/--query (default: {VexaConfig.SOCKET_PATH})"
     )
     
     parser.add_argument(
@@ -204,6 +465,18 @@ Examples:
         help="Show available tools information and exit"
     )
     
+    parser.add_argument(
+        "--deep-health",
+        action="store_true",
+        help="Verify the agent with a full test query at startup (slower)"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't reuse responses for repeated questions"
+    )
+    
     parser.add_argument(
         "--models",
         action="store_true",
@@ -221,18 +494,43 @@ Examples:
         return
     
     # Create CLI instance
-    cli = VexaCLI(model_name=args.model, verbose=args.verbose)
+    cli = VexaCLI(
+        model_name=args.model,
+        verbose=args.verbose,
+        deep_health=args.deep_health,
+        use_cache=not args.no_cache,
+        socket_path=args.socket
+    )
     
     if args.tools_info:
         cli.show_tools_info()
         return
     
-    if args.query:
-        cli.run_single_query(args.query)
-        return
-    
-    # Run interactive mode
-    cli.run_interactive()
+    try:
+        if args.serve:
+            cli.serve()
+            return
+        
+        queries = list(args.query or [])
+        if args.queries_file:
+            try:
+                queries.extend(load_queries_file(args.queries_file))
+            except OSError as e:
+                print(f"❌ Could not read queries file {args.queries_file}: {e.strerror or e}")
+                sys.exit(1)
+        
+        if len(queries) == 1:
+            cli.run_single_query(queries[0])
+            return
+        
+        if queries:
+            cli.run_batch_queries(queries)
+            return
+        
+        # Run interactive mode
+        cli.run_interactive()
+    finally:
+        cli.close()
 
 
 if __name__ == "__main__":
@@ -6,14 +6,9 @@ This demo mode shows VEXA functionality without requiring Ollama to be installed
 It uses simulated responses to demonstrate the agent's capabilities.
 """
 
-import sys
-import os
-
 import sys
 import os
 import datetime
-import math
-import json
 
 # Add current directory and agent directory to path for imports
 current_dir = os.getcwd()
@@ -22,54 +17,106 @@ sys.path.insert(0, os.path.join(current_dir, 'agent'))
 
 try:
     from agent import VexaConfig
+    from agent.dispatch import compile_keyword_dispatch
 except ImportError:
     # Fallback if agent module not available
     class VexaConfig:
         AVAILABLE_MODELS = ["mistral", "llama2", "llama3"]
+    
+    def compile_keyword_dispatch(keyword_groups):
+        """Build a function that returns the index of the first category matching a text, or None"""
+        def match(text):
+            return next((i for i, words in enumerate(keyword_groups) if any(w in text for w in words)), None)
+        return match
+
+
+_now = datetime.datetime.now
+_DT_FMT = '%Y-%m-%d %H:%M:%S'
+
+_MATH_OPS = "+-*/"
+_NUMBER_CHARS = "0123456789."
+
+
+def _find_binary_expression(text: str):
+    """Find the first 'number op number' (e.g. "15 + 27") in text using plain string scans"""
+    for i, op in enumerate(text):
+        if op not in _MATH_OPS:
+            continue
+        
+        # Number ending just before the operator (spaces allowed in between)
+        end = i
+        while end > 0 and text[end - 1].isspace():
+            end -= 1
+        start = end
+        while start > 0 and text[start - 1] in _NUMBER_CHARS:
+            start -= 1
+        
+        # Number starting just after the operator
+        left = i + 1
+        while left < len(text) and text[left].isspace():
+            left += 1
+        right = left
+        while right < len(text) and text[right] in _NUMBER_CHARS:
+            right += 1
+        
+        try:
+            return float(text[start:end]), op, float(text[left:right])
+        except ValueError:
+            continue
+    return None
+
+
+# Query categories in priority order (first matching category wins)
+_DISPATCH_KEYWORDS = (
+    ('+', '-', '*', '/', 'calculate', 'math'),
+    ('time', 'date', 'today'),
+    ('search', 'news', 'weather', 'find'),
+    ('list', 'files', 'directory'),
+)
+
+
+_match_category = compile_keyword_dispatch(_DISPATCH_KEYWORDS)
 
 
 class VexaDemo:
     """Demo version of VEXA that works without Ollama"""
     
+    # Static part of the general response, joined once
+    _GENERAL_TAIL = "\n\n" + "\n\n".join([
+        "In the full version with Ollama, I can provide detailed answers, search the web, and use various tools to help you.",
+        "This demo shows the structure and capabilities of VEXA without requiring Ollama to be installed."
+    ])
+    
     def __init__(self):
         self.model_name = "demo-mode"
         self.tools = [
             "web_search", "calculator", "datetime", "file_ops", "weather"
         ]
+        # Handlers in _DISPATCH_KEYWORDS priority order, indexed by category
+        self._routes = (
+            self._handle_math,
+            self._handle_datetime,
+            self._handle_search,
+            self._handle_files,
+        )
     
     def query(self, question: str) -> dict:
         """Process query in demo mode"""
-        question_lower = question.lower()
-        
-        # Calculator responses
-        if any(op in question for op in ['+', '-', '*', '/', 'calculate', 'math']):
-            return self._handle_math(question)
-        
-        # Time/date responses
-        elif any(word in question_lower for word in ['time', 'date', 'today']):
-            return self._handle_datetime(question)
-        
-        # Search responses
-        elif any(word in question_lower for word in ['search', 'news', 'weather', 'find']):
-            return self._handle_search(question)
-        
-        # File operations
-        elif any(word in question_lower for word in ['list', 'files', 'directory']):
-            return self._handle_files(question)
-        
-        # General responses
-        else:
-            return self._handle_general(question)
+        return self._dispatch(question, question.lower())
+    
+    def _dispatch(self, question: str, question_lower: str) -> dict:
+        """Route a query to its handler; question_lower is computed once by the caller"""
+        category = _match_category(question_lower)
+        handler = self._routes[category] if category is not None else self._handle_general
+        return handler(question)
     
     def _handle_math(self, question: str) -> dict:
         """Handle mathematical queries"""
         try:
-            # Try to extract and calculate simple expressions
-            import re
-            # Look for simple math expressions
-            match = re.search(r'(\d+(?:\.\d+)?)\s*([+\-*/])\s*(\d+(?:\.\d+)?)', question)
-            if match:
-                num1, op, num2 = float(match.group(1)), match.group(2), float(match.group(3))
+            # Look for simple math expressions (skip the scan if there's no operator at all)
+            expression = _find_binary_expression(question) if any(c in question for c in _MATH_OPS) else None
+            if expression:
+                num1, op, num2 = expression
                 if op == '+':
                     result = num1 + num2
                 elif op == '-':
@@ -93,10 +140,9 @@ class VexaDemo:
     
     def _handle_datetime(self, question: str) -> dict:
         """Handle date/time queries"""
-        now = datetime.datetime.now()
         return {
             "success": True,
-            "response": f"Using the datetime tool:\nCurrent date and time: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+            "response": f"Using the datetime tool:\nCurrent date and time: {_now().strftime(_DT_FMT)}"
         }
     
     def _handle_search(self, question: str) -> dict:
@@ -109,7 +155,13 @@ class VexaDemo:
     def _handle_files(self, question: str) -> dict:
         """Handle file operation queries"""
         try:
-            files = os.listdir('.')[:10]  # Limit to 10 files
+            # Read only the first 10 entries instead of the whole directory
+            files = []
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    if len(files) >= 10:
+                        break
+                    files.append(entry.name)
             file_list = ', '.join(files)
             return {
                 "success": True,
@@ -123,15 +175,9 @@ class VexaDemo:
     
     def _handle_general(self, question: str) -> dict:
         """Handle general queries"""
-        responses = [
-            f"Hello! I'm VEXA running in demo mode. Your question was: '{question}'",
-            "In the full version with Ollama, I can provide detailed answers, search the web, and use various tools to help you.",
-            "This demo shows the structure and capabilities of VEXA without requiring Ollama to be installed."
-        ]
-        
         return {
             "success": True,
-            "response": "\n\n".join(responses)
+            "response": f"Hello! I'm VEXA running in demo mode. Your question was: '{question}'" + self._GENERAL_TAIL
         }
     
     def get_model_info(self) -> dict:
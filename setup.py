@@ -12,12 +12,21 @@ import platform
 
 
 def run_command(command, description=""):
-    """Run a system command and return success status"""
+    """Run a system command and return success status
+    
+    command may be a shell string or an argument list (run without a shell).
+    """
     if description:
         print(f"🔄 {description}")
     
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        result = subprocess.run(
+            command,
+            shell=isinstance(command, str),
+            capture_output=True,
+            text=True,
+            check=False
+        )
         if result.returncode == 0:
             print(f"✅ Success: {description}")
             return True, result.stdout
@@ -57,12 +66,10 @@ def install_dependencies():
         "python-dateutil>=2.8.0"
     ]
     
-    for package in packages:
-        success, output = run_command(f"pip install {package}", f"Installing {package}")
-        if not success:
-            return False
-    
-    return True
+    # One pip run resolves all packages together and reuses its HTTP session
+    command = [sys.executable, "-m", "pip", "install", *packages]
+    success, output = run_command(command, f"Installing {len(packages)} packages")
+    return success
 
 
 def check_ollama():
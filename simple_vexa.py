@@ -12,6 +12,40 @@ import os
 sys.path.insert(0, os.getcwd())
 
 from agent import VexaTools, VexaConfig
+from agent.dispatch import compile_keyword_dispatch
+
+_EXPR_CHARS = frozenset("0123456789+-*/.() \t")
+
+
+def _extract_expression(query: str) -> str:
+    """Get the first run of digits, operators and parentheses that contains a number"""
+    start = None
+    for i, c in enumerate(query):
+        if c in _EXPR_CHARS:
+            if start is None:
+                start = i
+            continue
+        if start is not None:
+            run = query[start:i].strip()
+            if any(ch.isdigit() for ch in run):
+                return run
+            start = None
+    
+    run = query[start:].strip() if start is not None else ""
+    return run if any(ch.isdigit() for ch in run) else ""
+
+
+# Query categories in priority order (first matching category wins)
+_DISPATCH_KEYWORDS = (
+    ('calculate', 'math', '+', '-', '*', '/', '='),
+    ('time', 'date', 'today', 'now'),
+    ('list', 'files', 'directory', 'folder'),
+    ('help', 'tools', 'commands'),
+)
+
+
+_match_category = compile_keyword_dispatch(_DISPATCH_KEYWORDS)
+
 
 class SimpleVEXA:
     """Simple VEXA interface without LLM"""
@@ -22,34 +56,38 @@ class SimpleVEXA:
             'datetime': VexaTools.get_datetime_tool(), 
             'file_ops': VexaTools.get_file_operations_tool()
         }
+        # Bind the tool functions once for the per-query path
+        self._calc = self.tools['calculator'].func
+        self._dt = self.tools['datetime'].func
+        self._files = self.tools['file_ops'].func
         print("🤖 Simple VEXA initialized!")
         print("Available tools:", list(self.tools.keys()))
     
     def process_query(self, query: str) -> str:
         """Process user query with available tools"""
+        # Lowercase once; dispatch and the case-insensitive tools share it
         query_lower = query.lower()
+        category = _match_category(query_lower)
         
         # Calculator queries
-        if any(word in query_lower for word in ['calculate', 'math', '+', '-', '*', '/', '=']):
+        if category == 0:
             if any(op in query for op in ['+', '-', '*', '/']):
                 # Extract the math expression
-                import re
-                match = re.search(r'([0-9+\-*/\.\(\)\s]+)', query)
-                if match:
-                    expression = match.group(1).strip()
-                    return self.tools['calculator'].func(expression)
-            return self.tools['calculator'].func(query)
+                expression = _extract_expression(query)
+                if expression:
+                    return self._calc(expression)
+            return self._calc(query)
         
         # DateTime queries
-        elif any(word in query_lower for word in ['time', 'date', 'today', 'now']):
-            return self.tools['datetime'].func(query)
+        elif category == 1:
+            return self._dt(query_lower)
         
         # File operations
-        elif any(word in query_lower for word in ['list', 'files', 'directory', 'folder']):
-            return self.tools['file_ops'].func(query)
+        elif category == 2:
+            return self._files(query)
         
         # Help
-        elif any(word in query_lower for word in ['help', 'tools', 'commands']):
+        elif category == 3:
             return """Available commands:
 🧮 Calculator: "calculate 2+2", "what's 15*23?"
 📅 DateTime: "what time is it?", "current date"
@@ -53,14 +53,303 @@ def test_tools():
         traceback.print_exc()
         return False
 
+def test_calculator_expressions():
+    """Test which expressions the calculator evaluates and which it rejects"""
+    print("\n🧮 Testing calculator expressions...")
+    
+    try:
+        from agent import VexaTools
+        calculate = VexaTools.get_calculator_tool().func
+        
+        allowed = {
+            "15 * 23 + 45": "Result: 390",
+            "sqrt(16)": "Result: 4.0",
+            "math.log(100, 10)": "Result: 2.0",
+            "round(2.567, 1)": "Result: 2.6",
+            "abs(-3) + 7 % 3": "Result: 4",
+            "2**10": "Result: 1024",
+        }
+        # Unsafe names, attribute escapes, unsupported syntax and CPU-heavy inputs
+        rejected = [
+            "__import__('os')", "open(1)", "(1).real", "math.sys", "math.factorial(10)",
+            "math.comb(10, 5)", "9**9**9", "2**4095 * 2**4095", "round(5, -100000000)",
+            "1, 2", "x + 1",
+        ]
+        
+        ok = True
+        for expression, expected in allowed.items():
+            result = calculate(expression)
+            if result != expected:
+                print(f"❌ {expression!r} gave {result!r}, expected {expected!r}")
+                ok = False
+        for expression in rejected:
+            result = calculate(expression)
+            if not result.startswith("Error"):
+                print(f"❌ {expression!r} should be rejected, gave {result!r}")
+                ok = False
+        if ok:
+            print(f"✅ {len(allowed)} expressions evaluated, {len(rejected)} rejected")
+        
+        return ok
+    except Exception as e:
+        print(f"❌ Calculator error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_response_cache():
+    """Test cache reuse, TTL expiry and the exemptions for stale-prone answers"""
+    print("\n🗄️ Testing response cache...")
+    
+    try:
+        from langchain_core.language_models.fake import FakeListLLM
+        from agent.core import VexaAgent
+        agent = VexaAgent(verbose=False, preload=False, cache_ttl=60)
+        
+        def ask(question, *responses):
+            agent.llm = FakeListLLM(responses=list(responses))
+            agent._build_executor()
+            return agent.query(question, use_history=False)
+        
+        checks = []
+        first = ask("what is six times seven", "Action: calculator\nAction Input: 6*7", "Final Answer: 42")
+        checks.append(("tools_used is filled in", first["tools_used"] == ["calculator"]))
+        checks.append(("repeat is cached", ask("What is six  times seven", "Final Answer: other").get("cached")))
+        
+        # Age every entry past the 60 s TTL
+        agent._cache = {key: (stored_at - 61, result) for key, (stored_at, result) in agent._cache.items()}
+        checks.append(("expired entry is refreshed", ask("what is six times seven", "Final Answer: fresh")["response"] == "fresh"))
+        
+        ask("what is the latest version", "Final Answer: 1.0")
+        checks.append(("time-sensitive wording isn't cached", not ask("what is the latest version", "Final Answer: 2.0").get("cached")))
+        
+        ask("which weekday is it", "Action: datetime\nAction Input: date", "Final Answer: Monday")
+        checks.append(("datetime runs aren't cached", not ask("which weekday is it", "Final Answer: Tuesday").get("cached")))
+        
+        # The same question after new observations is a different context
+        agent._turn_history.append("- calculator(6*7): Result: 42")
+        agent.llm = FakeListLLM(responses=["Final Answer: with history"])
+        agent._build_executor()
+        checks.append(("history is part of the key", not agent.query("what is six times seven").get("cached")))
+        
+        for label, passed in checks:
+            print(f"{'✅' if passed else '❌'} {label}")
+        return all(passed for _, passed in checks)
+    except Exception as e:
+        print(f"❌ Cache error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_search_batch_validation():
+    """Test web_search_batch input parsing and limits without touching the network"""
+    print("\n🔎 Testing web_search_batch input...")
+    
+    try:
+        import json
+        import agent.tools as tools
+        from agent import VexaConfig, VexaTools
+        
+        class StubSearch:
+            def run(self, query):
+                return f"results for {query}"
+        
+        get_search = tools._get_search
+        tools._get_search = StubSearch
+        try:
+            search_batch = VexaTools.get_web_search_batch_tool().func
+            checks = [
+                ("JSON list", search_batch('["a", " b "]') == "[a]\nresults for a\n\n[b]\nresults for b"),
+                ("single JSON string", search_batch('"solo"') == "[solo]\nresults for solo"),
+                ("one query per line", search_batch("a\nb\n").count("results for") == 2),
+            ]
+            for bad in ("42", "null", '{"a": 1}', "[1, 2]", "[]", ""):
+                checks.append((f"rejects {bad!r}", search_batch(bad).startswith("Error: Provide a JSON list")))
+            too_many = json.dumps([f"q{i}" for i in range(VexaConfig.SEARCH_BATCH_LIMIT + 1)])
+            checks.append(("enforces the batch limit", search_batch(too_many).startswith("Error: At most")))
+        finally:
+            tools._get_search = get_search
+        
+        for label, passed in checks:
+            print(f"{'✅' if passed else '❌'} {label}")
+        return all(passed for _, passed in checks)
+    except Exception as e:
+        print(f"❌ Search batch error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_fast_path():
+    """Test which queries skip the LLM and that tool errors fall back to the agent"""
+    print("\n⚡ Testing fast path...")
+    
+    try:
+        from agent.core import VexaAgent
+        agent = VexaAgent(verbose=False, preload=False)
+        
+        routes = {
+            "15 * 23 + 45": ("calculator", "Result: 390"),
+            "What time is it?": ("datetime", "Current time:"),
+            "pwd": ("file_ops", "Current directory:"),
+            "list files": ("file_ops", "Files in '.':"),
+        }
+        checks = []
+        for question, (tool, prefix) in routes.items():
+            result = agent._fast_path(question)
+            checks.append((
+                f"{question!r} -> {tool}",
+                result is not None and result["tools_used"] == [tool] and result["response"].startswith(prefix)
+            ))
+        
+        # Tool errors, "~" paths and anything conversational go to the agent
+        for question in ("1/0", "list ./no-such-directory", "list ~", "what is 2+2 in binary"):
+            checks.append((f"{question!r} -> agent", agent._fast_path(question) is None))
+        
+        for label, passed in checks:
+            print(f"{'✅' if passed else '❌'} {label}")
+        return all(passed for _, passed in checks)
+    except Exception as e:
+        print(f"❌ Fast path error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_batch_queries():
+    """Test that query_batch can be called more than once on the same agent"""
+    print("\n📦 Testing batch queries...")
+    
+    try:
+        from agent.core import VexaAgent
+        agent = VexaAgent(verbose=False, preload=False, cache_ttl=0)
+        questions = ["2+2", "pwd", "Say hello"]
+        
+        for attempt in (1, 2):
+            results = agent.query_batch(questions)
+            loop_errors = [r for r in results if "Event loop is closed" in r.get("error", "")]
+            if len(results) != len(questions) or loop_errors:
+                print(f"❌ Batch {attempt} failed: {results}")
+                return False
+            print(f"✅ Batch {attempt}: {results[0]['response']}")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Batch error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_stream_retraction():
+    """Test that a streamed answer the model turns into an Action is retracted"""
+    print("\n📡 Testing streamed answers...")
+    
+    try:
+        import re
+        from langchain_core.language_models.fake import FakeListLLM
+        from agent.core import VexaAgent
+        
+        class TokenLLM(FakeListLLM):
+            """Fake LLM that reports its response word by word, like a streaming Ollama model"""
+            def _call(self, prompt, stop=None, run_manager=None, **kwargs):
+                text = super()._call(prompt, stop, run_manager, **kwargs)
+                if run_manager:
+                    for token in re.split(r"(\s+)", text):
+                        run_manager.on_llm_new_token(token)
+                return text
+        
+        # First step starts a Final Answer and then names an Action (a parsing error)
+        responses = [
+            "Thought: easy\nFinal Answer: bogus partial\nAction: calculator\nAction Input: 2+2",
+            "Thought: done\nFinal Answer: The answer is 4",
+        ]
+        agent = VexaAgent(verbose=False, preload=False, cache_ttl=0)
+        
+        ok = True
+        for live in (True, False):
+            agent.llm = TokenLLM(responses=list(responses))
+            agent._build_executor()
+            chunks = []
+            on_retract = chunks.clear if live else None
+            for chunk in agent.stream_query("add two and two", on_retract=on_retract):
+                chunks.append(chunk)
+            mode = "live" if live else "buffered"
+            if "".join(chunks) != "The answer is 4":
+                print(f"❌ {mode} stream gave {chunks}")
+                ok = False
+            else:
+                print(f"✅ {mode} stream: {''.join(chunks)}")
+        
+        return ok
+    except Exception as e:
+        print(f"❌ Streaming error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_keyword_dispatch():
+    """Test that every dispatch backend picks the same category as ordered keyword checks"""
+    print("\n🔀 Testing keyword dispatch...")
+    
+    try:
+        import random
+        import agent.dispatch as dispatch
+        from demo import _DISPATCH_KEYWORDS as demo_keywords
+        from simple_vexa import _DISPATCH_KEYWORDS as simple_keywords
+        
+        backends = [("re", None, None)]
+        if dispatch.ahocorasick is not None:
+            backends.append(("ahocorasick", dispatch.ahocorasick, None))
+        if dispatch.re2 is not None:
+            backends.append(("re2", None, dispatch.re2))
+        aho, re2 = dispatch.ahocorasick, dispatch.re2
+        
+        # Overlapping keywords from different categories, plus random mixes
+        texts = ["checklistoday", "findate", "searchtime", "listfiles", "nowhelp", "2+2 today", ""]
+        rng = random.Random(0)
+        words = [word for groups in (demo_keywords, simple_keywords) for group in groups for word in group]
+        for _ in range(2000):
+            texts.append("".join(rng.choice(words + ["a", " ", "x"]) for _ in range(rng.randint(1, 6))))
+        
+        ok = True
+        try:
+            for name, dispatch_aho, dispatch_re2 in backends:
+                dispatch.ahocorasick, dispatch.re2 = dispatch_aho, dispatch_re2
+                for keywords in (demo_keywords, simple_keywords):
+                    match = dispatch.compile_keyword_dispatch(keywords)
+                    for text in texts:
+                        expected = next((i for i, group in enumerate(keywords) if any(w in text for w in group)), None)
+                        if match(text) != expected:
+                            print(f"❌ {name}: {text!r} -> {match(text)}, expected {expected}")
+                            ok = False
+                            break
+                if ok:
+                    print(f"✅ {name} backend matches ordered checks")
+        finally:
+            dispatch.ahocorasick, dispatch.re2 = aho, re2
+        
+        return ok
+    except Exception as e:
+        print(f"❌ Dispatch error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     print("🔍 VEXA Component Test")
     print("=" * 50)
     
-    imports_ok = test_imports()
-    tools_ok = test_tools()
+    results = [
+        test_imports(),
+        test_tools(),
+        test_calculator_expressions(),
+        test_response_cache(),
+        test_search_batch_validation(),
+        test_fast_path(),
+        test_batch_queries(),
+        test_stream_retraction(),
+        test_keyword_dispatch(),
+    ]
     
-    if imports_ok and tools_ok:
+    if all(results):
         print("\n🎉 All components working!")
         print("\n📋 Next steps:")
         print("   • Demo mode: python demo.py")
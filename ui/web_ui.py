@@ -6,17 +6,23 @@ A simple web interface for interacting with the VEXA AI Agent.
 Provides a clean, ChatGPT-like experience in the browser.
 """
 
-import gradio as gr
+from __future__ import annotations
+
 import sys
 import os
 import logging
-from typing import List, Tuple, Optional
-import traceback
+from typing import TYPE_CHECKING, List, Tuple, Optional
 
 # Add parent directory to path to import agent module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from agent import VexaAgent, create_vexa_agent, VexaConfig
+# Gradio and the agent (LangChain) are imported when first needed, so --help
+# and early errors don't pay for them
+from agent import VexaConfig
+
+if TYPE_CHECKING:
+    import gradio as gr
+    from agent import VexaAgent
 
 
 class VexaWebUI:
@@ -35,6 +41,7 @@ class VexaWebUI:
     def initialize_agent(self) -> Tuple[bool, str]:
         """Initialize the agent"""
         try:
+            from agent import create_vexa_agent
             self.agent = create_vexa_agent(
                 model_name=self.model_name,
                 verbose=False  # Disable verbose for web UI
@@ -58,8 +65,9 @@ class VexaWebUI:
                 return "", history + [[message, f"🚨 {msg}\n\nPlease ensure Ollama is running with the {self.model_name} model."]]
         
         try:
-            # Process the query
-            response = self.agent.query(message)
+            # Process the query; the agent is shared by every browser session,
+            # so observations from one chat aren't fed into another
+            response = self.agent.query(message, use_history=False)
             
             if response["success"]:
                 bot_response = f"🤖 {response['response']}"
@@ -102,6 +110,7 @@ class VexaWebUI:
     
     def create_interface(self) -> gr.Blocks:
         """Create the Gradio interface"""
+        import gradio as gr
         
         # Custom CSS for better styling
         custom_css = """
@@ -222,6 +231,7 @@ class VexaWebUI:
         except Exception as e:
             print(f"❌ Failed to launch web UI: {e}")
             if debug:
+                import traceback
                 traceback.print_exc()
 
 